@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+"""markitdown conversions run in the server's executor pool.
+
+Kept apart from server.py so pool workers only import markitdown.
+"""
+
+import functools
+import io
+from typing import Optional
+import markitdown
+
+@functools.lru_cache(maxsize=1)
+def get_markitdown() -> markitdown.MarkItDown:
+    """Get the shared MarkItDown instance, created on first use."""
+    return markitdown.MarkItDown()
+
+def convert_path(input_path: str, url: Optional[str] = None) -> str:
+    """Run markitdown on a file path."""
+    kwargs = {"url": url} if url else {}
+    return get_markitdown().convert(input_path, **kwargs).text
+
+def convert_bytes(content: bytes, extension: str, url: str) -> str:
+    """Run markitdown on in-memory content."""
+    stream = io.BytesIO(content)
+    return get_markitdown().convert_stream(stream, file_extension=f".{extension}", url=url).text
@@ -1,84 +1,373 @@
 #!/usr/bin/env python3
 
+import ipaddress
 import os
+import re
 import tempfile
 import shutil
 import asyncio
+import concurrent.futures
+import concurrent.futures.process
+import multiprocessing
+import functools
+import importlib.util
+import atexit
+from collections import OrderedDict, deque
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
+from urllib.parse import urlparse
 from fastapi import FastAPI
 from mcp.server.fastmcp import FastMCP
 from mcp.types import Tool
 from pydantic import BaseModel
 import httpx
-import markitdown
+import convert_worker
 
 # Initialize FastAPI app and FastMCP server
 app = FastAPI()
 mcp = FastMCP("python-mcp-markdownify-server")
 
-# Models for tool arguments
-class YouTubeToMarkdownArgs(BaseModel):
-    url: str
-
-class PDFToMarkdownArgs(BaseModel):
-    filepath: str
-
-class BingSearchResultToMarkdownArgs(BaseModel):
-    url: str
+def _select_temp_dir() -> str:
+    """Pick the temp directory, preferring MD_TMPDIR and then tmpfs."""
+    md_tmpdir = os.environ.get("MD_TMPDIR")
+    if md_tmpdir:
+        return md_tmpdir
+    if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK):
+        return "/dev/shm"
+    return tempfile.gettempdir()
+
+# Keep conversion temp files in RAM-backed storage when possible
+tempfile.tempdir = _select_temp_dir()
+
+# Shared HTTP client, created on startup and reused across tool calls
+_HTTP_CLIENT: Optional[httpx.AsyncClient] = None
+
+# LRU cache of conversion results: key -> (output path, markdown text, expiry).
+# File keys change with the file and never expire; URL keys expire after
+# MD_URL_CACHE_TTL seconds on the event loop clock.
+_CACHE: "OrderedDict[str, tuple[str, str, Optional[float]]]" = OrderedDict()
+_CACHE_MAX = int(os.environ.get("MD_CACHE_ENTRIES", "256"))
+_URL_CACHE_TTL = float(os.environ.get("MD_URL_CACHE_TTL", "300"))
+
+# Whether to write converted markdown to a temp file and return its path
+_EMIT_PATH = os.environ.get("MD_EMIT_PATH", "false").lower() in ("1", "true", "yes")
+_OUTPUT_FILES_MAX = int(os.environ.get("MD_OUTPUT_FILES", "256"))
+_OUTPUT_FILES: "deque[str]" = deque()
+
+# Executor for blocking markitdown conversions, created on startup
+_USE_THREADS = os.environ.get("MD_USE_THREADS") == "1"
+_CONVERT_POOL: Optional[concurrent.futures.Executor] = None
+
+def _create_convert_pool() -> concurrent.futures.Executor:
+    """Create the executor for blocking markitdown conversions.
+
+    Threads are used if MD_USE_THREADS=1, otherwise worker processes are
+    spawned explicitly so the platform's default start method never forks
+    the running server.
+    """
+    if _USE_THREADS:
+        return concurrent.futures.ThreadPoolExecutor()
+    return concurrent.futures.ProcessPoolExecutor(
+        max_workers=os.cpu_count(),
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=convert_worker.get_markitdown,
+    )
+
+def _get_convert_pool() -> concurrent.futures.Executor:
+    """Get the conversion pool, creating it if startup has not run."""
+    global _CONVERT_POOL
+    if _CONVERT_POOL is None:
+        _CONVERT_POOL = _create_convert_pool()
+    return _CONVERT_POOL
+
+# Limits how many conversions run at once
+_CONVERT_SEM = asyncio.Semaphore(
+    int(os.environ.get("MD_MAX_CONCURRENT", str(max(2, os.cpu_count() or 2))))
+)
 
-class WebpageToMarkdownArgs(BaseModel):
+# Models for tool arguments, shared by every tool taking the same field
+class UrlArgs(BaseModel):
     url: str
 
-class ImageToMarkdownArgs(BaseModel):
+class FilepathArgs(BaseModel):
     filepath: str
 
-class AudioToMarkdownArgs(BaseModel):
-    filepath: str
+# Maximum number of urls plus filepaths accepted by convert-batch
+_BATCH_MAX = int(os.environ.get("MD_BATCH_MAX", "100"))
 
-class DocxToMarkdownArgs(BaseModel):
-    filepath: str
+class BatchArgs(BaseModel):
+    urls: List[str] = []
+    filepaths: List[str] = []
 
-class XlsxToMarkdownArgs(BaseModel):
-    filepath: str
-
-class PptxToMarkdownArgs(BaseModel):
-    filepath: str
-
-class GetMarkdownFileArgs(BaseModel):
-    filepath: str
+# Extensions accepted by get-markdown-file
+_MD_EXTS = (".md", ".markdown")
 
 # Utility functions
-def _is_private_ip(hostname: str) -> bool:
-    """Check if a hostname resolves to a private IP address."""
-    import ipaddress
+# Hostname -> (resolved addresses, expiry time on the event loop clock)
+_HOST_ADDRESS_CACHE: Dict[str, Tuple[Tuple[str, ...], float]] = {}
+_HOST_ADDRESS_TTL = 300.0
+_HOST_ADDRESS_CACHE_MAX = 1024
+
+def _is_private_address(address: str) -> bool:
+    """Check if an IP address literal is anything other than a public unicast address."""
+    ip = ipaddress.ip_address(address.split("%", 1)[0])
+    return not ip.is_global or ip.is_multicast
+
+async def _resolve_host(hostname: str) -> Tuple[str, ...]:
+    """Resolve a hostname to its IP addresses without blocking the event loop.
+
+    Results are cached for 300 seconds. Fetches connect to one of these
+    addresses (see _pinned_request), so a DNS answer that changes after
+    the check cannot redirect the connection to another host.
+    """
     try:
-        ip = ipaddress.ip_address(hostname)
-        return ip.is_private
+        ipaddress.ip_address(hostname)
+        return (hostname,)
     except ValueError:
-        # If it's not a direct IP, we'd need to resolve it
-        # For simplicity, we'll skip complex DNS resolution here
-        # and assume non-private for non-IP hostnames
-        return False
+        pass
+
+    loop = asyncio.get_running_loop()
+    now = loop.time()
+    cached = _HOST_ADDRESS_CACHE.get(hostname)
+    if cached is not None and cached[1] > now:
+        return cached[0]
+
+    addrinfo = await loop.getaddrinfo(hostname, None)
+    addresses = tuple(dict.fromkeys(info[4][0] for info in addrinfo))
+
+    if len(_HOST_ADDRESS_CACHE) >= _HOST_ADDRESS_CACHE_MAX:
+        for key in [k for k, (_, expiry) in _HOST_ADDRESS_CACHE.items() if expiry <= now]:
+            del _HOST_ADDRESS_CACHE[key]
+        if len(_HOST_ADDRESS_CACHE) >= _HOST_ADDRESS_CACHE_MAX:
+            _HOST_ADDRESS_CACHE.clear()
+    _HOST_ADDRESS_CACHE[hostname] = (addresses, now + _HOST_ADDRESS_TTL)
+    return addresses
+
+def _pinned_request(url: str, address: str) -> Tuple[httpx.URL, Dict[str, str], Dict[str, Any]]:
+    """Build (url, headers, extensions) that connect to a vetted address.
+
+    The host in the URL is replaced by the address, while the Host header
+    and the TLS server name keep the original hostname so virtual hosting
+    and certificate checks still work.
+    """
+    original = httpx.URL(url)
+    headers = {"Host": original.netloc.decode("ascii")}
+    extensions: Dict[str, Any] = {}
+    if original.scheme == "https":
+        extensions["sni_hostname"] = original.host
+    return original.copy_with(host=address), headers, extensions
 
 def _normalize_path(filepath: str) -> str:
     """Normalize a file path."""
     return os.path.normpath(os.path.expanduser(filepath))
 
+@functools.lru_cache(maxsize=1)
+def _resolve_share_dir(md_share_dir: str) -> str:
+    """Resolve the shared directory to a real path ending in a separator."""
+    return os.path.join(os.path.realpath(_normalize_path(md_share_dir)), "")
+
+_WRITE_CHUNK_SIZE = 1024 * 1024
+
+def _write_all(fd: int, content: bytes) -> None:
+    """Write all of content to a file descriptor in bounded slices."""
+    view = memoryview(content)
+    while view:
+        written = os.write(fd, view[:_WRITE_CHUNK_SIZE])
+        view = view[written:]
+
 def _save_to_temp_file(content: bytes, suggested_extension: Optional[str] = None) -> str:
     """Save content to a temporary file."""
     extension = suggested_extension or "md"
-    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=f".{extension}")
-    temp_file.write(content)
-    temp_file.close()
-    return temp_file.name
-
-async def _fetch_url_content(url: str) -> bytes:
-    """Fetch content from a URL."""
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url)
+    fd, path = tempfile.mkstemp(suffix=f".{extension}")
+    try:
+        _write_all(fd, content)
+    finally:
+        os.close(fd)
+    return path
+
+def _unlink_quietly(path: str) -> None:
+    """Remove a file, ignoring it if it is already gone."""
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+def _emit_output(markdown_text: str) -> str:
+    """Write markdown to a temp file if MD_EMIT_PATH is set, returning its path.
+
+    Only the most recent MD_OUTPUT_FILES outputs are kept on disk; older
+    ones are removed as new ones are written, and the rest at exit.
+    """
+    if not _EMIT_PATH:
+        return ""
+    output_path = _save_to_temp_file(markdown_text.encode(), "md")
+    _OUTPUT_FILES.append(output_path)
+    while len(_OUTPUT_FILES) > max(_OUTPUT_FILES_MAX, 1):
+        _unlink_quietly(_OUTPUT_FILES.popleft())
+    return output_path
+
+@atexit.register
+def _cleanup_output_files() -> None:
+    while _OUTPUT_FILES:
+        _unlink_quietly(_OUTPUT_FILES.popleft())
+
+# HTTP/2 needs the optional h2 package (installed with httpx[http2])
+_HAS_H2 = importlib.util.find_spec("h2") is not None
+
+def _create_http_client() -> httpx.AsyncClient:
+    """Create the shared HTTP client with a pooled connection limit."""
+    return httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        timeout=httpx.Timeout(30.0),
+        http2=_HAS_H2,
+    )
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client, creating it if startup has not run."""
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is None or _HTTP_CLIENT.is_closed:
+        _HTTP_CLIENT = _create_http_client()
+    return _HTTP_CLIENT
+
+# Content-Type -> file extension for downloaded content
+_CT_TO_EXT = {
+    "application/pdf": "pdf",
+    "text/html": "html",
+    "application/xhtml+xml": "html",
+    "text/plain": "txt",
+    "text/markdown": "md",
+    "text/csv": "csv",
+    "application/json": "json",
+    "application/xml": "xml",
+    "text/xml": "xml",
+    "application/rss+xml": "rss",
+    "application/atom+xml": "atom",
+    "image/png": "png",
+    "image/jpeg": "jpg",
+    "audio/mpeg": "mp3",
+    "audio/wav": "wav",
+    "audio/x-wav": "wav",
+    "audio/mp4": "m4a",
+    "application/zip": "zip",
+    "application/epub+zip": "epub",
+    "application/vnd.ms-outlook": "msg",
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document": "docx",
+    "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet": "xlsx",
+    "application/vnd.ms-excel": "xls",
+    "application/vnd.openxmlformats-officedocument.presentationml.presentation": "pptx",
+}
+_KNOWN_EXTS = frozenset(_CT_TO_EXT.values()) | {"htm", "jpeg", "markdown"}
+_EXT_RE = re.compile(r"\.([a-z0-9]{1,5})$", re.I)
+
+def _extension_from_response(url: str, response: httpx.Response) -> Optional[str]:
+    """Determine a file extension from the response Content-Type or URL path."""
+    content_type = response.headers.get("content-type", "").split(";")[0].strip().lower()
+    extension = _CT_TO_EXT.get(content_type)
+    if extension:
+        return extension
+    match = _EXT_RE.search(urlparse(url).path)
+    if match:
+        extension = match.group(1).lower()
+        if extension in _KNOWN_EXTS:
+            return extension
+    return None
+
+# Downloads up to this size are converted from memory instead of a temp file
+_INMEMORY_MAX = int(os.environ.get("MD_INMEMORY_MAX", str(8 * 1024 * 1024)))
+
+async def _download_url(
+    url: str, address: str, inmemory_max: int
+) -> Tuple[Optional[bytes], Optional[str], str]:
+    """Download a URL from a vetted address, returning (content, temp path, extension).
+
+    Small responses are kept in memory and returned as content; once a
+    response grows past inmemory_max it is spilled to a temporary file
+    and its path is returned instead.
+    """
+    pinned_url, headers, extensions = _pinned_request(url, address)
+    async with _get_http_client().stream(
+        "GET", pinned_url, headers=headers, extensions=extensions
+    ) as response:
         response.raise_for_status()
-        return response.content
+        extension = _extension_from_response(url, response) or "md"
+        buffer = bytearray()
+        fd: Optional[int] = None
+        path: Optional[str] = None
+        try:
+            async for chunk in response.aiter_bytes(chunk_size=65536):
+                if fd is None and len(buffer) + len(chunk) <= inmemory_max:
+                    buffer += chunk
+                    continue
+                if fd is None:
+                    fd, path = tempfile.mkstemp(suffix=f".{extension}")
+                    _write_all(fd, bytes(buffer))
+                    buffer.clear()
+                _write_all(fd, chunk)
+        except BaseException:
+            if fd is not None:
+                os.close(fd)
+                os.unlink(path)
+            raise
+        if fd is not None:
+            os.close(fd)
+            return None, path, extension
+        return bytes(buffer), None, extension
+
+def _file_cache_key(filepath: str) -> Optional[str]:
+    """Build a cache key for a local file that changes when the file does."""
+    norm_path = _normalize_path(filepath)
+    try:
+        stat = os.stat(norm_path)
+    except OSError:
+        return None
+    return f"{norm_path}:{stat.st_mtime_ns}:{stat.st_size}"
+
+def _cache_get(key: Optional[str]) -> Optional[Dict[str, str]]:
+    """Look up a cached conversion result, refreshing its LRU position."""
+    if key is None or key not in _CACHE:
+        return None
+    output_path, markdown_text, expiry = _CACHE[key]
+    if expiry is not None and expiry <= asyncio.get_running_loop().time():
+        del _CACHE[key]
+        return None
+    if _EMIT_PATH and not os.path.exists(output_path):
+        output_path = _emit_output(markdown_text)
+        _CACHE[key] = (output_path, markdown_text, expiry)
+    _CACHE.move_to_end(key)
+    return {"path": output_path, "text": markdown_text}
+
+def _cache_put(
+    key: Optional[str], output_path: str, markdown_text: str, ttl: Optional[float] = None
+) -> None:
+    """Store a conversion result, evicting the least recently used entries.
+
+    Entries stored with a ttl expire that many seconds from now.
+    """
+    if key is None or _CACHE_MAX <= 0 or (ttl is not None and ttl <= 0):
+        return
+    expiry = asyncio.get_running_loop().time() + ttl if ttl is not None else None
+    _CACHE[key] = (output_path, markdown_text, expiry)
+    _CACHE.move_to_end(key)
+    while len(_CACHE) > _CACHE_MAX:
+        _CACHE.popitem(last=False)
+
+async def _run_in_convert_pool(func, *args) -> str:
+    """Run a conversion in the pool, replacing the pool if a worker died.
+
+    A crashed worker (e.g. OOM-killed on a large file) breaks the whole
+    process pool; a fresh one is created so later conversions still work,
+    and the failure is reported for this call only.
+    """
+    global _CONVERT_POOL
+    pool = _get_convert_pool()
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(pool, func, *args)
+    except concurrent.futures.process.BrokenProcessPool:
+        if _CONVERT_POOL is pool:
+            _CONVERT_POOL = _create_convert_pool()
+            pool.shutdown(wait=False, cancel_futures=True)
+        raise
 
 # Core conversion logic
 async def _convert_to_markdown(
@@ -88,51 +377,75 @@ async def _convert_to_markdown(
     uv_path: Optional[str] = None,
 ) -> Dict[str, str]:
     """Convert a file or URL to Markdown using markitdown."""
+    input_path: str = ""
+    is_temporary: bool = False
     try:
-        input_path: str = ""
-        is_temporary: bool = False
+        cache_key: Optional[str] = None
+        content: Optional[bytes] = None
+        extension: str = ""
 
         if url:
             # Validate URL
             if not url.startswith(("http://", "https://")):
                 raise ValueError("Only http:// and https:// URLs are allowed.")
             
-            # Simple check for private IP (in a real implementation, you'd want a more robust check)
-            from urllib.parse import urlparse
-            parsed_url = urlparse(url)
-            if _is_private_ip(parsed_url.hostname or ""):
+            # Reject hosts that resolve to private or otherwise internal addresses
+            hostname = urlparse(url).hostname
+            if not hostname:
+                raise ValueError(f"URL {url} has no host.")
+            addresses = await _resolve_host(hostname)
+            if any(_is_private_address(address) for address in addresses):
                 raise ValueError(f"Fetching {url} is potentially dangerous, aborting.")
             
-            # Fetch content
-            content = await _fetch_url_content(url)
-            
-            # Determine extension
-            extension = None
-            if url.endswith(".pdf"):
-                extension = "pdf"
-            
-            # Save to temporary file
-            input_path = _save_to_temp_file(content, extension)
-            is_temporary = True
+            cache_key = url
         elif filepath:
+            cache_key = _file_cache_key(filepath)
             input_path = filepath
         else:
             raise ValueError("Either filepath or url must be provided")
 
-        # Convert using markitdown
-        result = markitdown.MarkItDown().convert(input_path)
-        markdown_text = result.text
+        cached = _cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Download and convert under the semaphore, so a burst of requests
+        # cannot buffer or spill every response body at once
+        async with _CONVERT_SEM:
+            if url:
+                # Fetch content, spilling to a temporary file if it is large.
+                # Keeping it in memory only pays off with threads; a process
+                # pool would pickle it through a pipe, so there it goes to a file
+                inmemory_max = (
+                    _INMEMORY_MAX
+                    if _USE_THREADS
+                    else 0
+                )
+                content, temp_path, extension = await _download_url(url, addresses[0], inmemory_max)
+                if temp_path is not None:
+                    input_path = temp_path
+                    is_temporary = True
+
+            # Convert using markitdown without blocking the event loop
+            if content is not None:
+                markdown_text = await _run_in_convert_pool(
+                    convert_worker.convert_bytes, content, extension, url
+                )
+            else:
+                markdown_text = await _run_in_convert_pool(convert_worker.convert_path, input_path, url)
         
-        # Save result to temporary file
-        output_path = _save_to_temp_file(markdown_text.encode(), "md")
+        # Save result to a temporary file only if callers want a path
+        output_path = _emit_output(markdown_text)
         
-        # Clean up temporary input file if needed
-        if is_temporary and os.path.exists(input_path):
-            os.unlink(input_path)
-            
+        _cache_put(cache_key, output_path, markdown_text, _URL_CACHE_TTL if url else None)
         return {"path": output_path, "text": markdown_text}
+    except asyncio.CancelledError:
+        raise
     except Exception as e:
-        raise Exception(f"Error processing to Markdown: {str(e)}")
+        raise RuntimeError(f"Error processing to Markdown: {e}") from e
+    finally:
+        # Clean up temporary input file if needed
+        if is_temporary:
+            _unlink_quietly(input_path)
 
 async def _get_markdown_file(filepath: str) -> Dict[str, str]:
     """Get an existing Markdown file."""
@@ -140,114 +453,116 @@ async def _get_markdown_file(filepath: str) -> Dict[str, str]:
     norm_path = _normalize_path(filepath)
     
     # Check file extension
-    allowed_extensions = [".md", ".markdown"]
-    if not any(norm_path.endswith(ext) for ext in allowed_extensions):
+    if not norm_path.endswith(_MD_EXTS):
         raise ValueError("Required file is not a Markdown file.")
     
-    # Check if file exists
-    if not os.path.exists(norm_path):
-        raise FileNotFoundError("File does not exist")
-    
     # Check if file is within allowed directory (if configured)
     md_share_dir = os.environ.get("MD_SHARE_DIR")
     if md_share_dir:
-        allowed_share_dir = _normalize_path(md_share_dir)
-        if not os.path.commonpath([norm_path, allowed_share_dir]) == allowed_share_dir:
-            raise PermissionError(f"Only files in {allowed_share_dir} are allowed.")
+        share_dir_prefix = _resolve_share_dir(md_share_dir)
+        real_path = os.path.realpath(norm_path)
+        if not (real_path + os.sep).startswith(share_dir_prefix):
+            raise PermissionError(f"Only files in {_normalize_path(md_share_dir)} are allowed.")
     
-    # Read file content
-    with open(norm_path, "r", encoding="utf-8") as f:
-        content = f.read()
+    # Read file content off the event loop, decoding it in one pass
+    try:
+        raw = await asyncio.to_thread(Path(norm_path).read_bytes)
+    except FileNotFoundError as e:
+        raise FileNotFoundError("File does not exist") from e
+    content = raw.decode("utf-8")
     
     return {"path": norm_path, "text": content}
 
 # Define MCP tools
-@mcp.tool(
-    name="youtube-to-markdown",
-    description="Convert a YouTube video to markdown, including transcript if available",
-    arguments=YouTubeToMarkdownArgs
-)
-async def youtube_to_markdown(args: YouTubeToMarkdownArgs) -> Dict[str, str]:
+async def _url_to_markdown(args: UrlArgs) -> Dict[str, str]:
     return await _convert_to_markdown(url=args.url)
 
-@mcp.tool(
-    name="pdf-to-markdown",
-    description="Convert a PDF file to markdown",
-    arguments=PDFToMarkdownArgs
-)
-async def pdf_to_markdown(args: PDFToMarkdownArgs) -> Dict[str, str]:
+async def _file_to_markdown(args: FilepathArgs) -> Dict[str, str]:
     return await _convert_to_markdown(filepath=args.filepath)
 
-@mcp.tool(
-    name="bing-search-to-markdown",
-    description="Convert a Bing search results page to markdown",
-    arguments=BingSearchResultToMarkdownArgs
-)
-async def bing_search_to_markdown(args: BingSearchResultToMarkdownArgs) -> Dict[str, str]:
-    return await _convert_to_markdown(url=args.url)
-
-@mcp.tool(
-    name="webpage-to-markdown",
-    description="Convert a webpage to markdown",
-    arguments=WebpageToMarkdownArgs
-)
-async def webpage_to_markdown(args: WebpageToMarkdownArgs) -> Dict[str, str]:
-    return await _convert_to_markdown(url=args.url)
-
-@mcp.tool(
-    name="image-to-markdown",
-    description="Convert an image to markdown, including metadata and description",
-    arguments=ImageToMarkdownArgs
-)
-async def image_to_markdown(args: ImageToMarkdownArgs) -> Dict[str, str]:
-    return await _convert_to_markdown(filepath=args.filepath)
-
-@mcp.tool(
-    name="audio-to-markdown",
-    description="Convert an audio file to markdown, including transcription if possible",
-    arguments=AudioToMarkdownArgs
-)
-async def audio_to_markdown(args: AudioToMarkdownArgs) -> Dict[str, str]:
-    return await _convert_to_markdown(filepath=args.filepath)
-
-@mcp.tool(
-    name="docx-to-markdown",
-    description="Convert a DOCX file to markdown",
-    arguments=DocxToMarkdownArgs
-)
-async def docx_to_markdown(args: DocxToMarkdownArgs) -> Dict[str, str]:
-    return await _convert_to_markdown(filepath=args.filepath)
-
-@mcp.tool(
-    name="xlsx-to-markdown",
-    description="Convert an XLSX file to markdown",
-    arguments=XlsxToMarkdownArgs
-)
-async def xlsx_to_markdown(args: XlsxToMarkdownArgs) -> Dict[str, str]:
-    return await _convert_to_markdown(filepath=args.filepath)
-
-@mcp.tool(
-    name="pptx-to-markdown",
-    description="Convert a PPTX file to markdown",
-    arguments=PptxToMarkdownArgs
-)
-async def pptx_to_markdown(args: PptxToMarkdownArgs) -> Dict[str, str]:
-    return await _convert_to_markdown(filepath=args.filepath)
+# (tool name, argument kind, description) for every conversion tool
+_TOOL_SPECS = [
+    ("youtube-to-markdown", "url", "Convert a YouTube video to markdown, including transcript if available"),
+    ("pdf-to-markdown", "filepath", "Convert a PDF file to markdown"),
+    ("bing-search-to-markdown", "url", "Convert a Bing search results page to markdown"),
+    ("webpage-to-markdown", "url", "Convert a webpage to markdown"),
+    ("image-to-markdown", "filepath", "Convert an image to markdown, including metadata and description"),
+    ("audio-to-markdown", "filepath", "Convert an audio file to markdown, including transcription if possible"),
+    ("docx-to-markdown", "filepath", "Convert a DOCX file to markdown"),
+    ("xlsx-to-markdown", "filepath", "Convert an XLSX file to markdown"),
+    ("pptx-to-markdown", "filepath", "Convert a PPTX file to markdown"),
+]
+
+_TOOL_HANDLERS = {
+    "url": (UrlArgs, _url_to_markdown),
+    "filepath": (FilepathArgs, _file_to_markdown),
+}
+
+for _name, _kind, _description in _TOOL_SPECS:
+    _arguments, _handler = _TOOL_HANDLERS[_kind]
+    mcp.tool(name=_name, description=_description, arguments=_arguments)(_handler)
 
 @mcp.tool(
     name="get-markdown-file",
     description="Get a markdown file by absolute file path",
-    arguments=GetMarkdownFileArgs
+    arguments=FilepathArgs
 )
-async def get_markdown_file(args: GetMarkdownFileArgs) -> Dict[str, str]:
+async def get_markdown_file(args: FilepathArgs) -> Dict[str, str]:
     return await _get_markdown_file(args.filepath)
 
+@mcp.tool(
+    name="convert-batch",
+    description="Convert several URLs and/or files to markdown concurrently",
+    arguments=BatchArgs
+)
+async def convert_batch(args: BatchArgs) -> List[Dict[str, str]]:
+    sources = [("url", url) for url in args.urls] + [("filepath", path) for path in args.filepaths]
+    if len(sources) > _BATCH_MAX:
+        raise ValueError(f"convert-batch accepts at most {_BATCH_MAX} sources, got {len(sources)}.")
+    results = await asyncio.gather(
+        *(_convert_to_markdown(**{kind: source}) for kind, source in sources),
+        return_exceptions=True,
+    )
+    batch: List[Dict[str, str]] = []
+    for (kind, source), result in zip(sources, results):
+        if isinstance(result, asyncio.CancelledError):
+            raise result
+        if isinstance(result, BaseException):
+            batch.append({kind: source, "error": str(result)})
+        else:
+            batch.append({kind: source, **result})
+    return batch
+
 # Mount MCP to FastAPI
 app.mount("/mcp", mcp.streamable_http_app())
 
+# Lifecycle of the shared HTTP client
+@app.on_event("startup")
+async def _startup_http_client():
+    _get_http_client()
+
+@app.on_event("shutdown")
+async def _shutdown_http_client():
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is not None:
+        await _HTTP_CLIENT.aclose()
+        _HTTP_CLIENT = None
+
+# Lifecycle of the conversion pool
+@app.on_event("startup")
+async def _startup_convert_pool():
+    _get_convert_pool()
+
+@app.on_event("shutdown")
+async def _shutdown_convert_pool():
+    global _CONVERT_POOL
+    if _CONVERT_POOL is not None:
+        _CONVERT_POOL.shutdown(wait=False, cancel_futures=True)
+        _CONVERT_POOL = None
+
 # Health check endpoint
 @app.get("/")
-async def health_check():
+async def health_check() -> Dict[str, str]:
     return {"status": "ok", "server": "python-mcp-markdownify-server"}
 
 if __name__ == "__main__":